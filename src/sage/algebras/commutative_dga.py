@@ -369,17 +369,19 @@ class Differential(UniqueRepresentation, Morphism,
         A = self.domain()
         dom = A.basis(n)
         cod = A.basis(n + 1)
-        cokeys = [next(iter(a.lift().dict().keys())) for a in cod]
-        m = matrix(A.base_ring(), len(dom), len(cod))
+        cokeys = {next(iter(a.lift().dict())): k
+                  for k, a in enumerate(cod)}
+        entries = {}
         for i in range(len(dom)):
             im = self(dom[i])
             dic = im.lift().dict()
-            for j in dic.keys():
-                k = cokeys.index(j)
-                m[i, k] = dic[j]
+            for j, c in dic.items():
+                entries[i, cokeys[j]] = c
+        m = matrix(A.base_ring(), len(dom), len(cod), entries)
         m.set_immutable()
         return m
 
+    @cached_method
     def coboundaries(self, n):
         r"""
         The ``n``-th coboundary group of the algebra.
@@ -423,6 +425,7 @@ class Differential(UniqueRepresentation, Morphism,
         mor = V0.Hom(V1)(M)
         return mor.image()
 
+    @cached_method
     def cocycles(self, n):
         r"""
         The ``n``-th cocycle group of the algebra.
@@ -454,6 +457,7 @@ class Differential(UniqueRepresentation, Morphism,
         mor = V0.Hom(V1)(M)
         return mor.kernel()
 
+    @cached_method
     def cohomology_raw(self, n):
         r"""
         The ``n``-th cohomology group of ``self``.
@@ -490,6 +494,7 @@ class Differential(UniqueRepresentation, Morphism,
         """
         return self.cocycles(n).quotient(self.coboundaries(n))
 
+    @cached_method
     def cohomology(self, n):
         r"""
         The ``n``-th cohomology group of ``self``.
@@ -534,11 +539,14 @@ class Differential(UniqueRepresentation, Morphism,
             [0 0 1 0 0 0 0 0 0 0]
         """
         H = self.cohomology_raw(n)
-        H_basis_raw = [H.lift(H.basis()[i]) for i in range(H.dimension())]
+        lift = H.lift_map()
+        # One matrix product instead of one quotient-space lift per
+        # basis vector; the rows are the lifts in ambient coordinates.
+        H_basis_raw = (lift.matrix() * lift.codomain().basis_matrix()).rows()
         A = self.domain()
         B = A.basis(n)
-        H_basis = [sum(c * b for (c, b) in zip(coeffs, B)) for coeffs in
-                   H_basis_raw]
+        H_basis = [sum(coeffs[j] * B[j] for j in coeffs.support())
+                   for coeffs in H_basis_raw]
         # Put brackets around classes.
         H_basis_brackets = [CohomologyClass(b) for b in H_basis]
         return CombinatorialFreeModule(A.base_ring(),
@@ -548,6 +556,42 @@ class Differential(UniqueRepresentation, Morphism,
 
     homology = cohomology
 
+    def cohomology_range(self, degrees, ncpus=None):
+        r"""
+        The cohomology groups of ``self`` in several degrees.
+
+        The groups are computed in parallel, one degree per worker,
+        since the underlying linear algebra in each degree is
+        independent of the others.
+
+        INPUT:
+
+        - ``degrees`` -- iterable of degrees
+        - ``ncpus`` -- (optional) number of processes to use
+
+        OUTPUT:
+
+        A dictionary mapping each degree to the corresponding
+        cohomology group, as computed by :meth:`cohomology`.
+
+        EXAMPLES::
+
+            sage: A.<x,y,z,t> = GradedCommutativeAlgebra(QQ)
+            sage: d = A.cdg_algebra({x: x*y, y: x*y, z: z*t, t: t*z}).differential()
+            sage: H = d.cohomology_range(range(4))
+            sage: [H[i].dimension() for i in range(4)]
+            [1, 2, 1, 0]
+        """
+        from sage.parallel.decorate import parallel
+        degrees = list(degrees)
+
+        @parallel(ncpus=ncpus)
+        def _cohomology(n):
+            return self.cohomology(n)
+
+        return {args[0]: val
+                for (args, kwds), val in _cohomology(degrees)}
+
     def _is_nonzero(self):
         """
         Return ``True`` iff this morphism is nonzero.
@@ -648,17 +692,19 @@ class Differential_multigraded(Differential):
         n = G(vector(n))
         dom = A.basis(n)
         cod = A.basis(n + self._degree_of_differential)
-        cokeys = [next(iter(a.lift().dict().keys())) for a in cod]
-        m = matrix(self.base_ring(), len(dom), len(cod))
+        cokeys = {next(iter(a.lift().dict())): k
+                  for k, a in enumerate(cod)}
+        entries = {}
         for i in range(len(dom)):
             im = self(dom[i])
             dic = im.lift().dict()
-            for j in dic.keys():
-                k = cokeys.index(j)
-                m[i, k] = dic[j]
+            for j, c in dic.items():
+                entries[i, cokeys[j]] = c
+        m = matrix(self.base_ring(), len(dom), len(cod), entries)
         m.set_immutable()
         return m
 
+    @cached_method
     def coboundaries(self, n, total=False):
         """
         The ``n``-th coboundary group of the algebra.
@@ -706,6 +752,7 @@ class Differential_multigraded(Differential):
         mor = V0.Hom(V1)(M)
         return mor.image()
 
+    @cached_method
     def cocycles(self, n, total=False):
         r"""
         The ``n``-th cocycle group of the algebra.
@@ -751,6 +798,7 @@ class Differential_multigraded(Differential):
         mor = V0.Hom(V1)(M)
         return mor.kernel()
 
+    @cached_method
     def cohomology_raw(self, n, total=False):
         r"""
         The ``n``-th cohomology group of the algebra.
@@ -795,6 +843,7 @@ class Differential_multigraded(Differential):
         """
         return self.cocycles(n, total).quotient(self.coboundaries(n, total))
 
+    @cached_method
     def cohomology(self, n, total=False):
         r"""
         The ``n``-th cohomology group of the algebra.
@@ -828,10 +877,13 @@ class Differential_multigraded(Differential):
             Free module generated by {[b]} over Rational Field
         """
         H = self.cohomology_raw(n, total)
-        H_basis_raw = [H.lift(H.basis()[i]) for i in range(H.dimension())]
+        lift = H.lift_map()
+        # One matrix product instead of one quotient-space lift per
+        # basis vector; the rows are the lifts in ambient coordinates.
+        H_basis_raw = (lift.matrix() * lift.codomain().basis_matrix()).rows()
         A = self.domain()
         B = A.basis(n, total)
-        H_basis = [sum(c * b for (c, b) in zip(coeffs, B))
+        H_basis = [sum(coeffs[j] * B[j] for j in coeffs.support())
                    for coeffs in H_basis_raw]
         # Put brackets around classes.
         H_basis_brackets = [CohomologyClass(b) for b in H_basis]
@@ -1144,6 +1196,7 @@ class GCAlgebra(UniqueRepresentation, QuotientRing_nc):
                     result.append(tuple(mono))
         return result
 
+    @cached_method
     def basis(self, n):
         """
         Return a basis of the ``n``-th homogeneous component of ``self``.
@@ -2264,6 +2317,26 @@ class DifferentialGCAlgebra(GCAlgebra):
 
     homology = cohomology
 
+    def cohomology_range(self, degrees, ncpus=None):
+        r"""
+        The cohomology groups of ``self`` in several degrees, computed
+        in parallel.
+
+        INPUT:
+
+        - ``degrees`` -- iterable of degrees
+        - ``ncpus`` -- (optional) number of processes to use
+
+        EXAMPLES::
+
+            sage: A.<x,y,z,t> = GradedCommutativeAlgebra(QQ)
+            sage: B = A.cdg_algebra({x: x*y, y: x*y, z: z*t, t: t*z})
+            sage: H = B.cohomology_range(range(4))
+            sage: [H[i].dimension() for i in range(4)]
+            [1, 2, 1, 0]
+        """
+        return self._differential.cohomology_range(degrees, ncpus=ncpus)
+
     def cohomology_generators(self, max_degree):
         """
         Return lifts of algebra generators for cohomology in degrees at
@@ -2893,8 +2966,12 @@ class DifferentialGCAlgebra(GCAlgebra):
             # To avoid taking the degree of 0, we special-case it.
             if self.is_zero():
                 return True
+            C = self.parent().coboundaries(self.degree())
+            if C.dimension() == 0:
+                # A nonzero element cannot lie in a trivial subspace.
+                return False
             v = vector(self.basis_coefficients())
-            return v in self.parent().coboundaries(self.degree())
+            return v in C
 
         def is_cohomologous_to(self, other):
             """
@@ -2934,6 +3011,13 @@ class DifferentialGCAlgebra(GCAlgebra):
                or self.parent() is not other.parent()):
                 raise ValueError('The element {} does not lie in this DGA'
                                  .format(other))
+            if (not self.is_zero() and self.is_homogeneous()
+                    and other.is_homogeneous()
+                    and self.degree() != other.degree()):
+                # Homogeneous elements of different degrees are
+                # cohomologous iff both are coboundaries; checking the
+                # degrees first avoids computing self - other at all.
+                return self.is_coboundary() and other.is_coboundary()
             if (self - other).is_homogeneous():
                 return (self - other).is_coboundary()
             else:
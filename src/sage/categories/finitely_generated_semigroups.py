@@ -92,6 +92,25 @@ class FinitelyGeneratedSemigroups(CategoryWithAxiom):
 
         # TODO: update transitive ideal
 
+        @cached_method
+        def _semigroup_generators_tuple(self):
+            r"""
+            Return the distinguished semigroup generators of ``self``
+            as a tuple.
+
+            This caches the result of :meth:`semigroup_generators` in a
+            form suitable for the tight enumeration loops of
+            :meth:`succ_generators`, :meth:`__iter__` and :meth:`ideal`.
+
+            EXAMPLES::
+
+                sage: S = FiniteSemigroups().example()
+                sage: S._semigroup_generators_tuple()
+                ('a', 'b', 'c', 'd')
+            """
+            return tuple(self.semigroup_generators())
+
+        @cached_method
         def succ_generators(self, side="twosided"):
             r"""
             Return the successor function of the ``side``-sided Cayley
@@ -119,13 +138,20 @@ class FinitelyGeneratedSemigroups(CategoryWithAxiom):
                 sage: S.succ_generators("right")(S('ca'))
                 ('ca', 'cab', 'ca', 'cad')
                 sage: S.succ_generators("twosided" )(S('ca'))
-                ('ac', 'bca', 'ca', 'dca', 'ca', 'cab', 'ca', 'cad')
+                ('ac', 'bca', 'ca', 'dca', 'cab', 'cad')
 
             """
-            left = (side == "left" or side == "twosided")
-            right = (side == "right" or side == "twosided")
-            generators = self.semigroup_generators()
-            return lambda x: (tuple(g * x for g in generators) if left else ()) + (tuple(x * g for g in generators) if right else ())
+            generators = self._semigroup_generators_tuple()
+            if side == "left":
+                return lambda x, gens=generators: tuple(g * x for g in gens)
+            if side == "right":
+                return lambda x, gens=generators: tuple(x * g for g in gens)
+            # Dedupe at the source (preserving order): duplicated
+            # successors would only generate extra hash-set traffic in
+            # the traversals built on top of this function.
+            return lambda x, gens=generators: tuple(dict.fromkeys(
+                itertools.chain((g * x for g in gens),
+                                (x * g for g in gens))))
 
         def __iter__(self):
             r"""
@@ -189,11 +215,53 @@ class FinitelyGeneratedSemigroups(CategoryWithAxiom):
             """
             from sage.sets.recursively_enumerated_set import RecursivelyEnumeratedSet
             return RecursivelyEnumeratedSet(gens,
-                                            self.succ_generators(side=side))
+                                            self.succ_generators(side=side),
+                                            enumeration='breadth')
 
     class Finite(CategoryWithAxiom):
 
         class ParentMethods:
+
+            @cached_method
+            def _all_elements_tuple(self):
+                r"""
+                Return a tuple of all the elements of ``self``.
+
+                This runs the brute force enumeration of
+                :meth:`FinitelyGeneratedSemigroups.ParentMethods.__iter__`
+                once and caches the result, which is possible since
+                ``self`` is finite.
+
+                EXAMPLES::
+
+                    sage: S = FiniteSemigroups().example(alphabet=('x','y'))
+                    sage: sorted(S._all_elements_tuple())
+                    ['x', 'xy', 'y', 'yx']
+                """
+                from sage.sets.recursively_enumerated_set import RecursivelyEnumeratedSet
+                return tuple(RecursivelyEnumeratedSet(
+                    self.semigroup_generators(),
+                    self.succ_generators(side="right"),
+                    enumeration='breadth'))
+
+            def __iter__(self):
+                r"""
+                Return an iterator over the elements of ``self``.
+
+                The elements are computed once by the generic Cayley
+                graph traversal and cached, so iterating repeatedly
+                over ``self`` does not redo the traversal.
+
+                .. SEEALSO:: :meth:`_all_elements_tuple`
+
+                EXAMPLES::
+
+                    sage: S = FiniteSemigroups().example(alphabet=('x','y'))
+                    sage: sorted(S)
+                    ['x', 'xy', 'y', 'yx']
+                """
+                return iter(self._all_elements_tuple())
+
             def some_elements(self):
                 r"""
                 Return an iterable containing some elements of the semigroup.
@@ -74,7 +74,9 @@ from sage.structure.unique_representation import UniqueRepresentation
 from sage.structure.list_clone import ClonableArray
 from sage.structure.parent import Parent
 from sage.structure.element_wrapper import ElementWrapper
+from sage.misc.cachefunc import cached_function, cached_method
 from sage.misc.inherit_comparison import InheritComparisonClasscallMetaclass
+from sage.misc.lazy_attribute import lazy_attribute
 from sage.misc.misc_c import prod, running_total
 from sage.misc.latex import latex
 from sage.sets.set import Set_object
@@ -153,10 +155,17 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
             P = OrderedMultisetPartitionsIntoSets(_get_weight(X))
             return P.element_class(P, co)
 
-    def __init__(self, parent, data):
+    def __init__(self, parent, data, check=True):
         """
         Initialize ``self``.
 
+        INPUT:
+
+        - ``check`` -- (default: ``True``) whether to validate the
+          result against ``parent``; internal callers that build
+          elements known to be valid may pass ``False`` to skip the
+          containment test of :meth:`check`
+
         EXAMPLES::
 
             sage: c = OrderedMultisetPartitionsIntoSets(7)([[1,3], [1,2]])
@@ -190,7 +199,8 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
         if not _has_nonempty_sets(co):
             raise ValueError("cannot view %s as an ordered partition of %s"%(co, parent._Xtup))
 
-        ClonableArray.__init__(self, parent, [frozenset(k) for k in co])
+        ClonableArray.__init__(self, parent, [frozenset(k) for k in co],
+                               check=check)
         self._multiset = _get_multiset(co)
         self._weight = _get_weight(self._multiset)
         self._order = sum(len(block) for block in self)
@@ -223,6 +233,25 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
         if self not in self.parent():
             raise ValueError("{} not an element of {}".format(self, self.parent()))
 
+    @lazy_attribute
+    def _sorted_blocks(self):
+        r"""
+        The blocks of ``self``, each as a sorted tuple.
+
+        The blocks themselves are (unordered) frozensets; sorting them
+        is needed each time ``self`` is printed.  This is done once and
+        cached.
+
+        EXAMPLES::
+
+            sage: A = OrderedMultisetPartitionIntoSets([[4], [1,2,4]])
+            sage: A._sorted_blocks
+            ((4,), (1, 2, 4))
+        """
+        if self._n:
+            return tuple(tuple(sorted(k)) for k in self)
+        return tuple(tuple(sorted(k, key=str)) for k in self)
+
     def _repr_(self):
         """
         Return a string representation of ``self.``
@@ -248,18 +277,14 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
             "[{1, 11, 3, 4}, {3, 5, 'a'}]"
         """
         # TODO: simplify if/once ``_repr_`` method for ``Set`` sorts its elements.
-        if self._n:
-            string_parts = map(lambda k: str(sorted(k)), self)
-        else:
-            string_parts = map(lambda k: str(sorted(k, key=str)), self)
+        string_parts = map(lambda k: str(list(k)), self._sorted_blocks)
         string_parts = ", ".join(string_parts).replace("[","{").replace("]","}")
         return "[" + string_parts + "]"
 
     def _repr_tight(self):
         r"""
-        Starting from the standard Sage string representation of ``self``
-        as a list `[A_1, \ldots, A_r]` of sets, return the shorter string
-        gotten by deleting spaces within ``repr(A_i)``.
+        Return the string representation of ``self`` as a list
+        `[A_1, \ldots, A_r]` of sets, with no spaces within ``repr(A_i)``.
 
         EXAMPLES::
 
@@ -269,9 +294,9 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
             sage: A._repr_tight()
             '[{4}, {1,2,4}, {2,3}, {1}]'
         """
-        repr = self._repr_normal()
-        # eliminate spacing within blocks
-        return repr.replace(", ", ",").replace("},{", "}, {")
+        # TODO: simplify if/once ``_repr_`` method for ``Set`` sorts its elements.
+        return "[%s]" % ", ".join("{" + ",".join(repr(a) for a in k) + "}"
+                                  for k in self._sorted_blocks)
 
     def __hash__(self):
         """
@@ -354,7 +379,11 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
         """
         co = list(self) + list(other)
         X = _concatenate(co)
-        return OrderedMultisetPartitionsIntoSets(_get_weight(X))(co)
+        P = OrderedMultisetPartitionsIntoSets(_get_weight(X))
+        # The concatenation of two ordered multiset partitions into
+        # sets is again one, with the combined weight; no need to
+        # revalidate the blocks against the parent.
+        return P.element_class(P, co, check=False)
 
     @combinatorial_map(order=2, name='reversal')
     def reversal(self):
@@ -603,13 +632,36 @@ class OrderedMultisetPartitionIntoSets(ClonableArray,
             ....:      for k in range(1, 5) )
             True
         """
+        return list(self._deconcatenate_cached(k))
+
+    @cached_method
+    def _deconcatenate_cached(self, k):
+        r"""
+        Return a tuple of the `k`-deconcatenations of ``self``.
+
+        This caches the enumeration of :meth:`deconcatenate` on the
+        element, as the same deconcatenations are often requested
+        repeatedly.
+
+        EXAMPLES::
+
+            sage: A = OrderedMultisetPartitionIntoSets([[7,1],[3,4,5]])
+            sage: A._deconcatenate_cached(2)
+            (([{1,7}, {3,4,5}], []), ([{1,7}], [{3,4,5}]), ([], [{1,7}, {3,4,5}]))
+            sage: A._deconcatenate_cached(2) is A._deconcatenate_cached(2)
+            True
+        """
         P = OrderedMultisetPartitionsIntoSets(alphabet=self.letters(),
                                               max_length=self.length())
         out = []
         for c in IntegerListsLex(self.length(), length=k):
             ps = [sum(c[:i]) for i in range(k+1)]
-            out.append(tuple([P(self[ps[i]:ps[i+1]]) for i in range(len(ps)-1)]))
-        return out
+            # Consecutive runs of blocks of ``self`` are valid for ``P``
+            # by construction; skip the containment check.
+            out.append(tuple([P.element_class(P, self[ps[i]:ps[i+1]],
+                                              check=False)
+                              for i in range(len(ps)-1)]))
+        return tuple(out)
 
     def split_blocks(self, k=2):
         r"""
@@ -3043,6 +3095,25 @@ def _refine_block(S, strong=False):
     if not S:
         raise ValueError("S (=%s) must be nonempty"%S)
 
+    return list(_refine_block_cached(frozenset(S), strong))
+
+@cached_function
+def _refine_block_cached(S, strong):
+    r"""
+    Return a tuple of all possible refinements of the frozenset `S`.
+
+    This caches the refinement enumerations; :meth:`finer` on ordered
+    multiset partitions into sets calls it once per block, and the same
+    blocks recur across many partitions.
+
+    EXAMPLES::
+
+        sage: from sage.combinat.multiset_partition_into_sets_ordered import _refine_block_cached
+        sage: _refine_block_cached(frozenset([1, 2]), True)
+        ((frozenset({1}), frozenset({2})), (frozenset({1, 2}),))
+        sage: _refine_block_cached(frozenset([1, 2]), True) is _refine_block_cached(frozenset([1, 2]), True)
+        True
+    """
     if all(s in ZZ for s in S):
         X = sorted(S)
     else:
@@ -3060,7 +3131,7 @@ def _refine_block(S, strong=False):
             for pos in range(n):
                 a[w[pos]] = a[w[pos]].union({X[pos]})
             out.append(tuple(a))
-    return out
+    return tuple(out)
 
 def _is_initial_segment(lst):
     r"""
@@ -3101,6 +3172,25 @@ def _split_block(S, k=2):
          ({}, {2}, {4}), ({}, {2, 4}, {}), ({4}, {2}, {}),
          ({2}, {}, {4}), ({2}, {4}, {}), ({2, 4}, {}, {})]
     """
+    return list(_split_block_cached(frozenset(S), k))
+
+@cached_function
+def _split_block_cached(S, k):
+    r"""
+    Return a tuple of all splittings of the frozenset `S` into `k` parts.
+
+    This caches the splitting enumerations; :meth:`split_blocks` on
+    ordered multiset partitions into sets calls it once per block, and
+    the same blocks recur across many partitions.
+
+    EXAMPLES::
+
+        sage: from sage.combinat.multiset_partition_into_sets_ordered import _split_block_cached
+        sage: _split_block_cached(frozenset([1, 2, 3]), 1)
+        ((frozenset({1, 2, 3}),),)
+        sage: _split_block_cached(frozenset([1, 2, 3]), 1) is _split_block_cached(frozenset([1, 2, 3]), 1)
+        True
+    """
     if all(s in ZZ for s in S):
         X = sorted(S)
     else:
@@ -3112,7 +3202,7 @@ def _split_block(S, k=2):
         for pos in range(n):
             a[w[pos]] = a[w[pos]].union({X[pos]})
         out.append(tuple(a))
-    return out
+    return tuple(out)
 
 def _to_minimaj_blocks(T):
     r"""